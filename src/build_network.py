@@ -1,8 +1,20 @@
+import ast
+import hashlib
+import pickle
+from pathlib import Path
 import osmnx as ox
 import networkx as nx
 from shapely.geometry import shape
 import json
-from .config import PLACE, CORRIDOR_NAME_ALIASES, INPUTS
+from .config import (
+    PLACE, CORRIDOR_NAME_ALIASES, INPUTS, CACHE_DIR,
+    CONSOLIDATE_INTERSECTIONS, CONSOLIDATE_TOL_M, OSM_EXTRACT, STUDY_BBOX,
+)
+from .movement_graph import count_movements
+
+# Bump whenever consolidate_graph (or the build steps before it) changes,
+# so cached consolidated graphs from older code are not reused.
+CONSOLIDATION_VERSION = 1
 
 def _normalize_name(n):
     return str(n or "").lower().strip()
@@ -15,9 +27,128 @@ def load_corridor_buffer():
         return geom
     return None
 
-def build_graph():
-    # 1. Download the drivable network (unprojected, lat/lon coordinates)
-    G = ox.graph_from_place(PLACE, network_type="drive")
+def load_study_area():
+    p = INPUTS / "study_area.geojson"
+    if p.exists():
+        gj = json.loads(p.read_text())
+        return shape(gj["features"][0]["geometry"])
+    return None
+
+def _original_ids(value):
+    """
+    Normalize a consolidated node's 'osmid_original' attribute to a list.
+    Depending on the OSMnx version, merged clusters store a list or its string form.
+    """
+    if isinstance(value, str) and value.startswith("["):
+        return list(ast.literal_eval(value))
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+def _file_digest(p):
+    return hashlib.sha1(p.read_bytes()).hexdigest() if p.exists() else None
+
+def _cache_inputs(tolerance, extract=None):
+    """
+    Everything the consolidated graph depends on. Any change produces a new cache key,
+    so a stale graph (e.g. with outdated 'is_corridor' tags) is never returned.
+    """
+    inputs = {
+        "place": PLACE,
+        "corridor_aliases": sorted(CORRIDOR_NAME_ALIASES),
+        "corridor_buffer": _file_digest(INPUTS / "rustavelli_buffer.geojson"),
+        "tolerance": tolerance,
+        "osmnx": ox.__version__,
+        "consolidation_version": CONSOLIDATION_VERSION,
+    }
+    if extract is not None:
+        stat = extract.stat()
+        inputs["extract"] = {
+            "path": str(extract.resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "study_bbox": list(STUDY_BBOX) if STUDY_BBOX is not None else None,
+            "study_area": _file_digest(INPUTS / "study_area.geojson"),
+        }
+    return inputs
+
+def _consolidated_cache_path(tolerance, extract=None):
+    source = extract.name.split(".")[0] if extract is not None else PLACE
+    slug = _normalize_name(source).replace(",", "").replace(" ", "_")
+    inputs = json.dumps(_cache_inputs(tolerance, extract), sort_keys=True)
+    digest = hashlib.sha1(inputs.encode()).hexdigest()[:12]
+    return CACHE_DIR / f"{slug}_consolidated_{tolerance:g}m_{digest}.pkl"
+
+def consolidate_graph(G, tolerance=CONSOLIDATE_TOL_M):
+    """
+    Merge complex intersections (BRT median, dual carriageways) of the projected graph G.
+
+    Edges keep their attributes (including 'is_corridor'); lengths, bearings and
+    travel times are recomputed from the rebuilt geometries. Node attributes added:
+        - osmid_original: list of the original node IDs merged into this node
+        - highway: "traffic_signals" if any merged node was signalized
+    G.graph["node_map"] maps every original node ID to its consolidated node ID.
+    It is informational (for tracing merged nodes); crossings.geojson points are
+    snapped to the nearest consolidated node by main.load_crossing_whitelist.
+    """
+    C = ox.consolidate_intersections(
+        G, tolerance=tolerance, rebuild_graph=True, dead_ends=False, reconnect_edges=True
+    )
+
+    node_map = {}
+    for n, data in C.nodes(data=True):
+        originals = _original_ids(data.get("osmid_original", n))
+        data["osmid_original"] = originals
+        for o in originals:
+            node_map[o] = n
+        if any(G.nodes[o].get("highway") == "traffic_signals" for o in originals if o in G):
+            data["highway"] = "traffic_signals"
+    C.graph["node_map"] = node_map
+
+    # Extended edges no longer match their pre-merge length (older OSMnx keeps it)
+    for u, v, k, data in C.edges(keys=True, data=True):
+        geom = data.get("geometry")
+        if geom is not None:
+            data["length"] = geom.length
+        else:
+            du, dv = C.nodes[u], C.nodes[v]
+            data["length"] = ((du["x"] - dv["x"]) ** 2 + (du["y"] - dv["y"]) ** 2) ** 0.5
+
+    # Node positions moved, so bearings must be recomputed in lat/lon
+    C_latlon = ox.add_edge_bearings(ox.project_graph(C, to_crs="EPSG:4326"))
+    for u, v, k, data in C_latlon.edges(keys=True, data=True):
+        C[u][v][k]["bearing"] = data.get("bearing")
+
+    C = ox.add_edge_travel_times(C)
+    return C
+
+def _report_consolidation(G):
+    stats = G.graph["consolidation"]
+    print(
+        f"Consolidated intersections ({stats['tolerance']:g} m): "
+        f"nodes {stats['nodes_before']} -> {stats['nodes_after']}, "
+        f"movements {stats['movements_before']} -> {stats['movements_after']}"
+    )
+
+def build_graph(consolidate=CONSOLIDATE_INTERSECTIONS, tolerance=CONSOLIDATE_TOL_M, extract=OSM_EXTRACT):
+    extract = Path(extract) if extract is not None else None
+
+    # 0. Reuse a previously consolidated graph if one is cached
+    if consolidate:
+        cache_path = _consolidated_cache_path(tolerance, extract)
+        if cache_path.exists():
+            with open(cache_path, "rb") as f:
+                G = pickle.load(f)
+            _report_consolidation(G)
+            return G
+
+    # 1. Download the drivable network, or read it from a local extract
+    #    (unprojected, lat/lon coordinates)
+    if extract is not None:
+        from .osm_extract import graph_from_extract  # pyosmium is only needed here
+        G = graph_from_extract(extract, polygon=load_study_area(), bbox=STUDY_BBOX)
+    else:
+        G = ox.graph_from_place(PLACE, network_type="drive")
 
     # 2. Add edge bearings before any projection
     G = ox.add_edge_bearings(G)
@@ -40,4 +171,20 @@ def build_graph():
             by_geom = buffer_geom.buffer(5).intersects(data["geometry"])
         data["is_corridor"] = bool(by_name or by_geom)
 
+    # 6. Optionally consolidate complex intersections and cache the result
+    if consolidate:
+        n_nodes, n_moves = G.number_of_nodes(), count_movements(G)
+        G = consolidate_graph(G, tolerance=tolerance)
+        G.graph["consolidation"] = {
+            "tolerance": tolerance,
+            "nodes_before": n_nodes,
+            "nodes_after": G.number_of_nodes(),
+            "movements_before": n_moves,
+            "movements_after": count_movements(G),
+        }
+        _report_consolidation(G)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(G, f)
+
     return G
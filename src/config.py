@@ -3,6 +3,11 @@ from pathlib import Path
 # Study area — you can later swap for a bbox/polygon
 PLACE = "Tashkent, Uzbekistan"
 
+# Optional local OSM extract (.osm.pbf or OSM XML) used instead of Overpass,
+# clipped to data/inputs/study_area.geojson and/or STUDY_BBOX (west, south, east, north)
+OSM_EXTRACT = None
+STUDY_BBOX = None
+
 # Corridor name aliases for Shota Rustavelli (add more spellings as needed)
 CORRIDOR_NAME_ALIASES = {
     "shota rustavelli street",
@@ -22,6 +27,22 @@ PERP_TOL = 20              # | |delta| - 90 | <= PERP_TOL
 # Turn delay (seconds) — replace with HCM/field values as needed
 TURN_DELAY_S = 5
 
+# Sensitivity analysis: uniform ranges sampled per run.
+# Every range contains TURN_DELAY_S, the single delay used by src.main.
+TURN_DELAY_RANGES_S = {    # per-turn-type delay (seconds)
+    "through": (1, 6),
+    "right": (3, 9),
+    "left": (4, 15),
+    "uturn": (5, 20),
+}
+SPEED_MULT_RANGE = (0.7, 1.2)   # per-edge multiplier on imputed speeds
+SENSITIVITY_SAMPLES = 200
+SENSITIVITY_PERCENTILES = (5, 50, 95)
+
+# Intersection consolidation (merges BRT median / dual-carriageway node clusters)
+CONSOLIDATE_INTERSECTIONS = False
+CONSOLIDATE_TOL_M = 15     # nodes within this distance (meters) are merged
+
 # I/O
 DATA_DIR = Path("data")
 INPUTS = DATA_DIR / "inputs"
@@ -29,3 +50,8 @@ OUTPUTS = DATA_DIR / "outputs"
 ROUTES_DIR = OUTPUTS / "routes"
 SUMMARIES_DIR = OUTPUTS / "summaries"
 MAPS_DIR = OUTPUTS / "maps"
+RESULTS_DIR = OUTPUTS / "results"
+CACHE_DIR = DATA_DIR / "cache"
+
+# Scenario label used to partition the results store
+SCENARIO = "rustavelli_brt"
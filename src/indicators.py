@@ -22,7 +22,7 @@ def shortest_or_none(M, s, t):
 
 def summarize(G, M_base, M_policy, movements, saverow=None):
     rows = []
-    for mv in movements:
+    for i, mv in enumerate(movements):
         start = mv["entry_edge"]
         end = mv["policy_exit_edge"]
         pb = shortest_or_none(M_base, start, end)
@@ -34,6 +34,7 @@ def summarize(G, M_base, M_policy, movements, saverow=None):
         Tb = path_cost(M_base, pb)
         Tp = path_cost(M_policy, pp)
         rows.append({
+            "movement": i,
             "node": mv["node"],
             "type": mv["type"],
             "distance_baseline_m": Lb,
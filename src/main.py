@@ -1,11 +1,12 @@
 from pathlib import Path
 import geopandas as gpd
-from .config import ROUTES_DIR, SUMMARIES_DIR, INPUTS
+from .config import ROUTES_DIR, SUMMARIES_DIR, INPUTS, SCENARIO
 from .build_network import build_graph
 from .policies import build_policy_graphs
 from .od_catalog import candidate_movements
 from .indicators import summarize
 from .export_geo import movement_path_to_linestring, write_geojson, write_gpx
+from .results_store import write_results
 
 def load_crossing_whitelist(G):
     """
@@ -26,7 +27,7 @@ def ensure_output_dirs():
     ROUTES_DIR.mkdir(parents=True, exist_ok=True)
     SUMMARIES_DIR.mkdir(parents=True, exist_ok=True)
 
-def run():
+def run(scenario=SCENARIO, run_id=None):
     ensure_output_dirs()
     G = build_graph()
     whitelist = load_crossing_whitelist(G)
@@ -34,23 +35,29 @@ def run():
     M_base, M_policy = build_policy_graphs(G, crossings_whitelist_nodes=whitelist)
 
     lines_for_geo = []
+    paths = []
 
     def saverow(mv, path_baseline, path_policy):
         ln = movement_path_to_linestring(G, path_policy)  # use projected G here
         props = {"name": f"{mv['type']}_node_{mv['node']}"}
         lines_for_geo.append((ln, props))
+        paths.append((path_baseline, path_policy))
 
     df = summarize(G, M_base, M_policy, candidate_movements(G), saverow=saverow)
 
     out_csv = SUMMARIES_DIR / "rustavelli_detour_indicators.csv"
     df.to_csv(out_csv, index=False)
 
+    run_id = write_results(df, paths, G, scenario, run_id=run_id)
+
     out_geo = ROUTES_DIR / "rustavelli_detours.geojson"
     write_geojson(lines_for_geo, out_geo)
     out_gpx = ROUTES_DIR / "rustavelli_detours.gpx"
     write_gpx(lines_for_geo, out_gpx)
 
     print("Wrote outputs to:", out_csv, out_geo, out_gpx)
+    if run_id is not None:
+        print(f"Stored results for scenario={scenario} run_id={run_id}")
 
 if __name__ == "__main__":
     run()
@@ -22,6 +22,13 @@ def is_perp(delta, tol=PERP_TOL):
     """Return True if the turn angle is approximately 90° (±tol)."""
     return abs(abs(delta) - 90) <= tol
 
+def count_movements(G):
+    """
+    Count the unrestricted movements (edge -> outgoing edge pairs) of G.
+    This is the edge count of the baseline movement graph, without building it.
+    """
+    return sum(G.out_degree(v) for _, v in G.edges())
+
 def build_movement_graph(
     G,
     *,
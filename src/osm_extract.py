@@ -0,0 +1,165 @@
+"""
+Build the drivable street graph from a local OSM extract (.osm.pbf or OSM XML).
+
+The extract is streamed once with pyosmium: node locations go to pyosmium's
+C++ location index, and C++ tag filters hand only highway ways and traffic
+signal nodes to Python. Only drivable ways that touch the study area are kept,
+so memory scales with the study area rather than the extract.
+The result matches ox.graph_from_place(..., network_type="drive") closely
+enough for build_network.build_graph to process it the same way: unprojected
+MultiDiGraph, OSM node IDs, edge lengths, simplified topology, largest
+weakly connected component.
+"""
+import re
+import networkx as nx
+import osmium
+import osmnx as ox
+import shapely
+from shapely.geometry import box
+
+# OSMnx 2.1's "drive" Overpass filter with the default settings.default_access.
+# Each ["key"!~"regex"] drops a way whose tag matches the unanchored regex.
+_DRIVE_EXCLUDE = (
+    ("area", re.compile("yes")),
+    ("access", re.compile("private")),
+    ("highway", re.compile(
+        "abandoned|bridleway|bus_guideway|construction|corridor|cycleway|elevator|"
+        "escalator|footway|no|path|pedestrian|planned|platform|proposed|raceway|razed|"
+        "rest_area|service|services|steps|track"
+    )),
+    ("motor_vehicle", re.compile("no")),
+    ("motorcar", re.compile("no")),
+    ("service", re.compile("alley|driveway|emergency_access|parking|parking_aisle|private")),
+)
+
+# Way tags kept on edges (OSMnx's default useful_tags_way)
+_WAY_TAGS = (
+    "bridge", "tunnel", "oneway", "lanes", "ref", "name", "highway", "maxspeed",
+    "service", "access", "area", "landuse", "width", "est_width", "junction",
+)
+
+def _is_drivable(tags):
+    if tags.get("highway") is None:
+        return False
+    for key, pattern in _DRIVE_EXCLUDE:
+        value = tags.get(key)
+        if value is not None and pattern.search(value):
+            return False
+    return True
+
+# OSMnx's interpretation of the "oneway" tag
+_ONEWAY_VALUES = {"yes", "true", "1", "-1", "reverse", "T", "F"}
+_REVERSED_VALUES = {"-1", "reverse", "T"}
+
+def _oneway(tags):
+    """Return (is_oneway, reverse_direction) following OSMnx's interpretation."""
+    value = tags.get("oneway")
+    if value in _ONEWAY_VALUES or tags.get("junction") == "roundabout":
+        return True, value in _REVERSED_VALUES
+    return False, False
+
+class _DriveHandler(osmium.SimpleHandler):
+    def __init__(self, bounds):
+        super().__init__()
+        self.bounds = bounds
+        self.coords = {}
+        self.signals = set()
+        self.ways = []
+
+    def node(self, n):
+        # only traffic signal nodes get here (see _filters)
+        self.signals.add(n.id)
+
+    def way(self, w):
+        tags = w.tags
+        if not _is_drivable(tags):
+            return
+        west, south, east, north = self.bounds
+        coords = self.coords
+        refs = []
+        inside = False
+        for nd in w.nodes:
+            loc = nd.location
+            lon, lat = loc.lon_without_check(), loc.lat_without_check()
+            if west <= lon <= east and south <= lat <= north and loc.valid():
+                coords[nd.ref] = (lon, lat)
+                refs.append(nd.ref)
+                inside = True
+            else:
+                refs.append(None)
+        if inside:
+            self.ways.append((w.id, refs, {k: tags.get(k) for k in _WAY_TAGS if k in tags}))
+
+def _filters():
+    return [
+        osmium.filter.TagFilter(("highway", "traffic_signals")).enable_for(osmium.osm.NODE),
+        osmium.filter.KeyFilter("highway").enable_for(osmium.osm.WAY),
+    ]
+
+def graph_from_extract(filepath, polygon=None, bbox=None):
+    """
+    Read a drivable street graph from a local OSM extract.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        .osm.pbf or .osm/.osm.bz2 XML extract.
+    polygon : shapely Polygon or None
+        Study area in lat/lon. Nodes outside it are dropped.
+    bbox : tuple or None
+        (west, south, east, north) in lat/lon, applied together with polygon.
+        If both are None the whole extract is used.
+
+    Returns
+    -------
+    MultiDiGraph
+        Unprojected (EPSG:4326) graph ready for build_network.build_graph.
+    """
+    area = box(*bbox) if bbox is not None else None
+    if polygon is not None:
+        area = polygon if area is None else area.intersection(polygon)
+    bounds = area.bounds if area is not None else (-180, -90, 180, 90)
+
+    handler = _DriveHandler(bounds)
+    handler.apply_file(str(filepath), locations=True, idx="flex_mem", filters=_filters())
+
+    # Exact clip to the study polygon, vectorized over all collected nodes
+    keep = set(handler.coords)
+    if polygon is not None:
+        ids = list(handler.coords)
+        xs, ys = zip(*(handler.coords[i] for i in ids)) if ids else ((), ())
+        inside = shapely.contains_xy(area, xs, ys)
+        keep = {i for i, ok in zip(ids, inside) if ok}
+
+    # Collect edges first and add them in bulk; attribute dicts are copied per edge
+    edges = []
+    for way_id, refs, tags in handler.ways:
+        oneway, reverse = _oneway(tags)
+        # "reversed" marks edges running against the way's node order
+        attrs = {
+            backward: {**tags, "osmid": way_id, "oneway": oneway, "reversed": backward}
+            for backward in ((reverse,) if oneway else (False, True))
+        }
+        for a, b in zip(refs[:-1], refs[1:]):
+            if a not in keep or b not in keep or a == b:
+                continue
+            for backward, data in attrs.items():
+                edges.append((b, a, data) if backward else (a, b, data))
+
+    if not edges:
+        raise ValueError(f"no drivable ways found in {filepath} for the given study area")
+
+    G = nx.MultiDiGraph(crs="epsg:4326")
+    G.add_edges_from(edges)
+    for n, data in G.nodes(data=True):
+        data["x"], data["y"] = handler.coords[n]
+        if n in handler.signals:
+            data["highway"] = "traffic_signals"
+
+    # Same post-processing as graph_from_place: largest component, lengths, simplify
+    largest = max(nx.weakly_connected_components(G), key=len)
+    G.remove_nodes_from([n for n in G if n not in largest])
+    G = ox.distance.add_edge_lengths(G)
+    G = ox.simplify_graph(G)
+    nx.set_node_attributes(G, ox.stats.count_streets_per_node(G), "street_count")
+    return G
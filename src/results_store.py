@@ -0,0 +1,178 @@
+"""
+Columnar results store for indicator tables and movement paths.
+
+Layout under the store root:
+    indicators/scenario=<scenario>/run_id=<run_id>/<uuid>-0.parquet
+    edges/<key>.parquet
+
+Each indicator row carries its baseline and policy paths as int32 lists of edge IDs.
+Edge IDs index into a shared edge table (u, v, k, length, is_corridor) written once
+per distinct table content and referenced by the `edge_table` column. Every run goes
+to its own new partition, so appending a run never rewrites earlier ones, and a
+(scenario, run_id) pair can only be written once.
+"""
+import hashlib
+import uuid
+from datetime import datetime, timezone
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from .config import RESULTS_DIR
+
+# Columns of indicators.summarize, fixed so every partition shares one schema
+INDICATOR_SCHEMA = pa.schema([
+    ("movement", pa.int64()),
+    ("node", pa.int64()),
+    ("type", pa.string()),
+    ("distance_baseline_m", pa.float64()),
+    ("time_baseline_s", pa.float64()),
+    ("distance_policy_m", pa.float64()),
+    ("time_policy_s", pa.float64()),
+    ("delta_d_m", pa.float64()),
+    ("delta_t_s", pa.float64()),
+    ("efficiency", pa.float64()),
+    ("n_links_policy", pa.int64()),
+])
+
+# Full stored schema: indicators, encoded paths and partition columns
+STORE_SCHEMA = pa.schema(list(INDICATOR_SCHEMA) + [
+    ("path_baseline", pa.list_(pa.int32())),
+    ("path_policy", pa.list_(pa.int32())),
+    ("edge_table", pa.string()),
+    ("scenario", pa.string()),
+    ("run_id", pa.string()),
+])
+
+# Rows are sorted by (type, node) and split into row groups of this size, so
+# node/type filters can skip row groups of large runs via Parquet statistics
+ROW_GROUP_ROWS = 4096
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("scenario", pa.string()), ("run_id", pa.string())]),
+    flavor="hive",
+)
+
+def edge_table(G):
+    """
+    Build the shared edge table of G.
+    Returns (table, key, index) where index maps (u, v, k) -> int32 edge ID and
+    key is a digest of every stored column, so the same topology with different
+    lengths or corridor tags gets its own table.
+    """
+    us, vs, ks, lengths, corridor = [], [], [], [], []
+    for u, v, k, data in G.edges(keys=True, data=True):
+        us.append(u)
+        vs.append(v)
+        ks.append(k)
+        lengths.append(float(data.get("length", 0.0)))
+        corridor.append(bool(data.get("is_corridor", False)))
+
+    table = pa.table({
+        "edge_id": pa.array(range(len(us)), type=pa.int32()),
+        "u": pa.array(us, type=pa.int64()),
+        "v": pa.array(vs, type=pa.int64()),
+        "k": pa.array(ks, type=pa.int32()),
+        "length": pa.array(lengths, type=pa.float64()),
+        "is_corridor": pa.array(corridor, type=pa.bool_()),
+    })
+    key = hashlib.sha1(repr((us, vs, ks, lengths, corridor)).encode()).hexdigest()[:16]
+    index = {e: i for i, e in enumerate(zip(us, vs, ks))}
+    return table, key, index
+
+def write_results(df, paths, G, scenario, run_id=None, root=RESULTS_DIR):
+    """
+    Append one run to the store.
+
+    Parameters
+    ----------
+    df : DataFrame
+        Output of indicators.summarize.
+    paths : list of (path_baseline, path_policy)
+        Movement paths (lists of (u, v, k)) aligned with the rows of df.
+    G : MultiDiGraph
+        Street graph the paths refer to.
+    scenario : str
+        Scenario label (first partition level).
+    run_id : str or None
+        Run label (second partition level). Defaults to a UTC timestamp.
+
+    Returns the run_id written, or None if df is empty (nothing is written).
+    Raises FileExistsError if the (scenario, run_id) partition already exists.
+    """
+    if len(paths) != len(df):
+        raise ValueError(f"got {len(paths)} paths for {len(df)} indicator rows")
+    if run_id is None:
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    for label, value in (("scenario", scenario), ("run_id", run_id)):
+        if not value or "/" in value or "=" in value:
+            raise ValueError(f"{label} must be non-empty and contain no '/' or '=': {value!r}")
+    if df.empty:
+        return None
+    partition = root / "indicators" / f"scenario={scenario}" / f"run_id={run_id}"
+    if partition.exists():
+        raise FileExistsError(f"results for scenario={scenario} run_id={run_id} already exist: {partition}")
+
+    edges, key, index = edge_table(G)
+    edges_path = root / "edges" / f"{key}.parquet"
+    if not edges_path.exists():
+        edges_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(edges, edges_path)
+
+    list_type = pa.list_(pa.int32())
+    table = pa.Table.from_pandas(df, schema=INDICATOR_SCHEMA, preserve_index=False)
+    table = table.append_column(
+        "path_baseline", pa.array([[index[e] for e in pb] for pb, _ in paths], type=list_type)
+    )
+    table = table.append_column(
+        "path_policy", pa.array([[index[e] for e in pp] for _, pp in paths], type=list_type)
+    )
+    n = table.num_rows
+    table = table.append_column("edge_table", pa.array([key] * n, type=pa.string()))
+    table = table.append_column("scenario", pa.array([scenario] * n, type=pa.string()))
+    table = table.append_column("run_id", pa.array([run_id] * n, type=pa.string()))
+    table = table.sort_by([("type", "ascending"), ("node", "ascending")])
+
+    ds.write_dataset(
+        table,
+        root / "indicators",
+        format="parquet",
+        partitioning=PARTITIONING,
+        basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=ROW_GROUP_ROWS,
+    )
+    return run_id
+
+def load_results(root=RESULTS_DIR, *, scenario=None, run_id=None, node=None, type=None, columns=None):
+    """
+    Load indicator rows as a DataFrame, reading only what the filters need.
+
+    scenario, run_id, node and type accept a single value or a list of values.
+    Scenario/run filters prune whole partitions; node/type filters skip row groups
+    whose statistics exclude them (only matters for runs above ROW_GROUP_ROWS rows).
+    Pass `columns` to skip e.g. the path lists. An empty store gives an empty frame.
+    """
+    path = root / "indicators"
+    if not path.exists():
+        schema = STORE_SCHEMA if columns is None else pa.schema([STORE_SCHEMA.field(c) for c in columns])
+        return schema.empty_table().to_pandas()
+    dataset = ds.dataset(path, schema=STORE_SCHEMA, format="parquet", partitioning=PARTITIONING)
+
+    expr = None
+    for field, value in (("scenario", scenario), ("run_id", run_id), ("node", node), ("type", type)):
+        if value is None:
+            continue
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        cond = ds.field(field).isin(values)
+        expr = cond if expr is None else expr & cond
+
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+def load_edge_table(key, root=RESULTS_DIR):
+    """Return the edge table stored under `key` as a DataFrame indexed by edge_id."""
+    return pq.read_table(root / "edges" / f"{key}.parquet").to_pandas().set_index("edge_id")
+
+def decode_path(edge_ids, edges):
+    """Convert a list of edge IDs back to (u, v, k) tuples using an edge table DataFrame."""
+    sub = edges.loc[list(edge_ids)]
+    return list(zip(sub["u"].tolist(), sub["v"].tolist(), sub["k"].tolist()))
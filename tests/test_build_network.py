@@ -0,0 +1,99 @@
+import math
+import networkx as nx
+import osmnx as ox
+import pytest
+from shapely.geometry import LineString
+import src.build_network as build_network
+import src.osm_extract as osm_extract
+from src.build_network import consolidate_graph
+from tests.test_osm_extract import FIXTURE, BBOX
+
+X0, Y0 = 500000.0, 4570000.0   # UTM 42N central meridian, so grid north is true north
+MEDIAN_M = 6.0
+BLOCK_M = 200.0
+N_BLOCKS = 4
+
+def _nid(side, j):
+    return 10 * j + "LWER".index(side)
+
+def _dual_carriageway():
+    """
+    North-south corridor as two one-way carriageways MEDIAN_M apart, crossed every
+    BLOCK_M by a two-way side street. Each real intersection is two OSM nodes.
+    """
+    G = nx.MultiDiGraph(crs="EPSG:32642")
+    for j in range(N_BLOCKS):
+        y = Y0 + j * BLOCK_M
+        G.add_node(_nid("L", j), x=X0 - BLOCK_M, y=y)
+        G.add_node(_nid("W", j), x=X0, y=y)
+        G.add_node(_nid("E", j), x=X0 + MEDIAN_M, y=y)
+        G.add_node(_nid("R", j), x=X0 + MEDIAN_M + BLOCK_M, y=y)
+    G.nodes[_nid("E", 1)]["highway"] = "traffic_signals"
+    # conflicting tag in the same cluster: OSMnx alone would keep a list of both
+    G.nodes[_nid("W", 1)]["highway"] = "crossing"
+
+    def add(u, v, corridor):
+        pu, pv = G.nodes[u], G.nodes[v]
+        geom = LineString([(pu["x"], pu["y"]), (pv["x"], pv["y"])])
+        # deliberately wrong bearing: consolidate_graph must recompute it
+        G.add_edge(u, v, geometry=geom, length=geom.length, speed_kph=40.0,
+                   bearing=-1.0, is_corridor=corridor, osmid=len(G.edges))
+
+    for j in range(N_BLOCKS):
+        if j + 1 < N_BLOCKS:
+            add(_nid("W", j + 1), _nid("W", j), True)   # southbound carriageway
+            add(_nid("E", j), _nid("E", j + 1), True)   # northbound carriageway
+        for a, b in (("L", "W"), ("W", "E"), ("E", "R")):
+            a, b = _nid(a, j), _nid(b, j)
+            add(a, b, False)
+            add(b, a, False)
+    return ox.add_edge_travel_times(G)
+
+def test_consolidate_graph_keeps_tags_and_recomputes_geometry():
+    G = _dual_carriageway()
+    C = consolidate_graph(G, tolerance=10)
+
+    # each W/E pair merges into one node; side-street ends stay
+    assert C.number_of_nodes() == 3 * N_BLOCKS
+
+    node_map = C.graph["node_map"]
+    assert set(node_map) == set(G.nodes)
+    for n, data in C.nodes(data=True):
+        assert all(node_map[o] == n for o in data["osmid_original"])
+    for j in range(N_BLOCKS):
+        assert node_map[_nid("W", j)] == node_map[_nid("E", j)]
+
+    signal = node_map[_nid("E", 1)]
+    assert C.nodes[signal]["highway"] == "traffic_signals"
+    assert sum(d.get("highway") == "traffic_signals" for _, d in C.nodes(data=True)) == 1
+
+    assert any(d["is_corridor"] for *_, d in C.edges(data=True))
+    for u, v, k, data in C.edges(keys=True, data=True):
+        original = G.edges[data["u_original"], data["v_original"], 0]
+        assert data["is_corridor"] == original["is_corridor"]
+
+        assert data["length"] == pytest.approx(data["geometry"].length)
+        assert data["travel_time"] == pytest.approx(data["length"] / (40.0 / 3.6), rel=1e-3)
+
+        pu, pv = C.nodes[u], C.nodes[v]
+        expected = math.degrees(math.atan2(pv["x"] - pu["x"], pv["y"] - pu["y"])) % 360
+        diff = (data["bearing"] - expected + 180) % 360 - 180
+        assert abs(diff) < 0.5
+
+def test_build_graph_reports_reduction_on_cache_hit(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(build_network, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(build_network, "STUDY_BBOX", BBOX)
+
+    G = build_network.build_graph(consolidate=True, tolerance=15, extract=FIXTURE)
+    cold = capsys.readouterr().out
+    assert "Consolidated intersections (15 m)" in cold
+    stats = G.graph["consolidation"]
+    assert stats["nodes_after"] == G.number_of_nodes()
+
+    # second call must come from the cache and still report the same reduction
+    def fail(*args, **kwargs):
+        raise AssertionError("cache miss: extract was read again")
+    monkeypatch.setattr(osm_extract, "graph_from_extract", fail)
+    H = build_network.build_graph(consolidate=True, tolerance=15, extract=FIXTURE)
+    assert capsys.readouterr().out == cold
+    assert H.graph["consolidation"] == stats
@@ -0,0 +1,62 @@
+from pathlib import Path
+import pytest
+from shapely.geometry import box
+from src.osm_extract import graph_from_extract, _is_drivable
+
+FIXTURE = Path(__file__).parent / "data" / "oneway_roundabout.osm"
+BBOX = (69.265, 41.299, 69.275, 41.303)   # excludes node 9
+
+def _edges(G, osmid):
+    return [(u, v, d) for u, v, d in G.edges(data=True) if d["osmid"] == osmid]
+
+def test_oneway_directions_and_reversed_flag():
+    G = graph_from_extract(FIXTURE, bbox=BBOX)
+
+    (u, v, d), = _edges(G, 102)
+    assert (u, v) == (3, 4)
+    assert d["oneway"] is True and d["reversed"] is False
+
+    # oneway=-1: travel runs against the way's node order
+    (u, v, d), = _edges(G, 103)
+    assert (u, v) == (5, 4)
+    assert d["oneway"] is True and d["reversed"] is True
+
+    # roundabouts are one-way without an explicit tag
+    roundabout = _edges(G, 104)
+    assert roundabout
+    assert all(d["oneway"] is True and d["reversed"] is False for *_, d in roundabout)
+
+    two_way = _edges(G, 101)
+    assert sorted((u, v, d["reversed"]) for u, v, d in two_way) == [(1, 3, False), (3, 1, True)]
+    assert all(d["oneway"] is False for *_, d in two_way)
+
+def test_drive_filter_clip_and_node_tags():
+    G = graph_from_extract(FIXTURE, polygon=box(*BBOX))
+
+    assert G.graph["crs"] == "epsg:4326"
+    assert not _edges(G, 105)           # footway dropped
+    assert 8 not in G and 9 not in G    # footway-only node and clipped node
+    for osmid in (107, 108, 109, 110):  # services, rest_area, driveway, private;delivery
+        assert not _edges(G, osmid)
+    assert _edges(G, 111)               # access=destination is public
+    assert {10, 11, 12, 13}.isdisjoint(G) and 14 in G
+    assert G.nodes[3]["highway"] == "traffic_signals"
+    assert all(d["length"] > 0 for *_, d in G.edges(data=True))
+
+@pytest.mark.parametrize("tags, drivable", [
+    ({"highway": "residential"}, True),
+    ({"highway": "motorway_link"}, True),
+    ({"highway": "residential", "access": "destination"}, True),
+    ({"building": "yes"}, False),
+    ({"highway": "services"}, False),
+    ({"highway": "rest_area"}, False),
+    ({"highway": "service"}, False),
+    ({"highway": "residential", "service": "driveway"}, False),
+    ({"highway": "residential", "service": "parking_aisle"}, False),
+    ({"highway": "residential", "access": "private;delivery"}, False),
+    ({"highway": "residential", "area": "yes"}, False),
+    ({"highway": "primary", "motor_vehicle": "no"}, False),
+    ({"highway": "primary", "motorcar": "no"}, False),
+])
+def test_drive_filter_matches_osmnx(tags, drivable):
+    assert _is_drivable(tags) is drivable
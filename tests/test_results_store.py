@@ -0,0 +1,90 @@
+import networkx as nx
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+import src.results_store as results_store
+from src.results_store import (
+    INDICATOR_SCHEMA, write_results, load_results, load_edge_table, decode_path,
+)
+
+def _graph():
+    G = nx.MultiDiGraph()
+    for u, v in ((1, 2), (2, 3), (3, 4), (2, 5)):
+        G.add_edge(u, v, length=10.0 * u, is_corridor=(u == 2))
+    return G
+
+def _row(node, type_, efficiency=0.8):
+    return {
+        "movement": 0, "node": node, "type": type_,
+        "distance_baseline_m": 20.0, "time_baseline_s": 4.0,
+        "distance_policy_m": 30.0, "time_policy_s": 5.0,
+        "delta_d_m": 10.0, "delta_t_s": 1.0,
+        "efficiency": efficiency, "n_links_policy": 2,
+    }
+
+PATHS = [
+    ([(1, 2, 0), (2, 3, 0)], [(1, 2, 0), (2, 3, 0), (3, 4, 0)]),
+    ([(1, 2, 0)], [(1, 2, 0), (2, 5, 0)]),
+]
+
+def _df(*rows):
+    return pd.DataFrame(list(rows), columns=INDICATOR_SCHEMA.names)
+
+def test_write_append_filter_and_decode(tmp_path):
+    G = _graph()
+    write_results(_df(_row(3, "uturn"), _row(2, "left", None)), PATHS, G, "base", run_id="a", root=tmp_path)
+    write_results(_df(_row(2, "left")), PATHS[1:], G, "alt", run_id="b", root=tmp_path)
+
+    everything = load_results(tmp_path)
+    assert len(everything) == 3
+    assert everything["efficiency"].isna().sum() == 1
+
+    left = load_results(tmp_path, type="left")
+    assert sorted(left["scenario"]) == ["alt", "base"]
+    assert len(load_results(tmp_path, scenario="base", node=3)) == 1
+    assert load_results(tmp_path, scenario="alt", columns=["node"]).columns.tolist() == ["node"]
+
+    row = load_results(tmp_path, scenario="base", type="uturn").iloc[0]
+    edges = load_edge_table(row["edge_table"], tmp_path)
+    assert decode_path(row["path_baseline"], edges) == PATHS[0][0]
+    assert decode_path(row["path_policy"], edges) == PATHS[0][1]
+
+def test_edge_table_key_covers_attributes(tmp_path):
+    G = _graph()
+    write_results(_df(_row(3, "uturn")), PATHS[:1], G, "s", run_id="a", root=tmp_path)
+    for *_, data in G.edges(data=True):
+        data["is_corridor"] = False
+    write_results(_df(_row(3, "uturn")), PATHS[:1], G, "s", run_id="b", root=tmp_path)
+
+    keys = load_results(tmp_path).set_index("run_id")["edge_table"]
+    assert keys["a"] != keys["b"]
+    assert load_edge_table(keys["a"], tmp_path)["is_corridor"].sum() == 2
+    assert load_edge_table(keys["b"], tmp_path)["is_corridor"].sum() == 0
+
+def test_existing_run_is_not_written_twice(tmp_path):
+    G = _graph()
+    write_results(_df(_row(3, "uturn")), PATHS[:1], G, "s", run_id="a", root=tmp_path)
+    with pytest.raises(FileExistsError):
+        write_results(_df(_row(3, "uturn")), PATHS[:1], G, "s", run_id="a", root=tmp_path)
+    assert len(load_results(tmp_path)) == 1
+
+def test_rows_sorted_into_row_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_store, "ROW_GROUP_ROWS", 2)
+    rows = [_row(n, t) for n in (9, 1, 5) for t in ("uturn", "left")]
+    write_results(_df(*rows), PATHS[:1] * len(rows), _graph(), "s", run_id="a", root=tmp_path)
+
+    (part,) = (tmp_path / "indicators").rglob("*.parquet")
+    assert pq.ParquetFile(part).metadata.num_row_groups == 3
+    stored = pq.read_table(part).to_pandas()
+    assert list(zip(stored["type"], stored["node"])) == sorted(zip(stored["type"], stored["node"]))
+
+def test_empty_store_and_empty_run(tmp_path):
+    assert load_results(tmp_path).empty
+    assert load_results(tmp_path, columns=["node", "type"]).columns.tolist() == ["node", "type"]
+    assert write_results(_df(), [], _graph(), "s", root=tmp_path) is None
+    assert not (tmp_path / "indicators").exists()
+
+@pytest.mark.parametrize("run_id", ["x/y", "k=v", ""])
+def test_bad_run_id_rejected(tmp_path, run_id):
+    with pytest.raises(ValueError):
+        write_results(_df(_row(3, "uturn")), PATHS[:1], _graph(), "s", run_id=run_id, root=tmp_path)
@@ -0,0 +1,65 @@
+import functools
+import math
+import networkx as nx
+import pytest
+import src.sensitivity as sensitivity
+from src.config import TURN_DELAY_S
+from src.indicators import summarize
+from src.od_catalog import candidate_movements
+from src.policies import build_policy_graphs
+
+N = 5
+SPACING_M = 100.0
+CORRIDOR_ROW = 2
+
+def _nid(i, j):
+    return i * N + j
+
+def _grid():
+    """Two-way N x N street grid with an east-west corridor along row CORRIDOR_ROW."""
+    G = nx.MultiDiGraph(crs="EPSG:32642")
+    for i in range(N):
+        for j in range(N):
+            G.add_node(_nid(i, j), x=j * SPACING_M, y=i * SPACING_M)
+    for i in range(N):
+        for j in range(N):
+            for di, dj in ((0, 1), (1, 0)):
+                if i + di >= N or j + dj >= N:
+                    continue
+                a, b = _nid(i, j), _nid(i + di, j + dj)
+                corridor = di == 0 and i == CORRIDOR_ROW
+                # vary speeds so routes are not all ties
+                speed = 30.0 + 10.0 * ((i + j) % 3)
+                for u, v in ((a, b), (b, a)):
+                    pu, pv = G.nodes[u], G.nodes[v]
+                    bearing = math.degrees(math.atan2(pv["x"] - pu["x"], pv["y"] - pu["y"])) % 360
+                    G.add_edge(u, v, length=SPACING_M, bearing=bearing, is_corridor=corridor,
+                               travel_time=SPACING_M / (speed / 3.6))
+    return G
+
+def test_zero_width_ranges_reproduce_summarize(monkeypatch):
+    G = _grid()
+    whitelist = {_nid(CORRIDOR_ROW, 1), _nid(CORRIDOR_ROW, 3)}
+    M_base, M_policy = build_policy_graphs(G, crossings_whitelist_nodes=whitelist)
+    movements = candidate_movements(G)
+    expected = summarize(G, M_base, M_policy, movements).set_index("movement")
+    assert len(expected) > 10
+    assert expected.duplicated(["node", "type"]).any()   # movement index is needed to join
+
+    monkeypatch.setattr(sensitivity, "TURN_DELAY_RANGES_S", {t: (TURN_DELAY_S, TURN_DELAY_S) for t in sensitivity.TURN_TYPES})
+    monkeypatch.setattr(sensitivity, "SPEED_MULT_RANGE", (1.0, 1.0))
+    # small chunks so several multi-source Dijkstra batches are stitched together
+    monkeypatch.setattr(sensitivity, "batch_costs", functools.partial(sensitivity.batch_costs, chunk=3))
+
+    bands = sensitivity.run_sensitivity(G, M_base, M_policy, movements, n_samples=3, seed=0)
+    bands = bands.set_index("movement")
+
+    assert sorted(bands.index) == sorted(expected.index)
+    for i, row in bands.iterrows():
+        mv = movements[i]
+        assert (row["node"], row["type"]) == (mv["node"], mv["type"])
+        assert (row["entry_u"], row["entry_v"], row["entry_k"]) == mv["entry_edge"]
+        assert row["n_samples"] == 3
+        for p in (5, 50, 95):
+            assert row[f"delta_t_s_p{p}"] == pytest.approx(expected.loc[i, "delta_t_s"], abs=1e-9)
+            assert row[f"efficiency_p{p}"] == pytest.approx(expected.loc[i, "efficiency"], abs=1e-12)